@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from . import jsonio
+
 OPTIONS_PATH = Path("/data/options.json")
 UI_CONFIG_PATH = Path("/data/ui_config.json")
 
+StatKey = tuple[int, int]
+
+_SYMBOL_RE = re.compile(r"[^,\s]+")
+
 
 @dataclass(slots=True)
 class AddonOptions:
@@ -42,11 +50,37 @@ class EffectiveConfig:
     ui: UiConfig
 
 
+_json_cache: dict[Path, tuple[StatKey, dict[str, Any]]] = {}
+_json_cache_lock = threading.Lock()
+_effective_cache: tuple[tuple[Any, ...], EffectiveConfig] | None = None
+
+
+def parse_symbols(raw_symbols: str) -> list[str]:
+    """Split a comma/whitespace separated symbol list into upper-case symbols."""
+    return _SYMBOL_RE.findall(raw_symbols.upper())
+
+
+def _stat_key(path: Path) -> StatKey | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _load_json(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    """Parse ``path``, skipping the read entirely while its stat key is unchanged."""
+    with _json_cache_lock:
+        key = _stat_key(path)
+        if key is None:
+            _json_cache.pop(path, None)
+            return {}
+        cached = _json_cache.get(path)
+        if cached is None or cached[0] != key:
+            with path.open("rb") as handle:
+                cached = (key, jsonio.loads(handle.read()))
+            _json_cache[path] = cached
+        return copy.deepcopy(cached[1])
 
 
 def load_addon_options() -> AddonOptions:
@@ -70,7 +104,7 @@ def load_ui_config(default_threshold: float) -> UiConfig:
     symbols = raw.get("etf_symbols", [])
     if not isinstance(symbols, list):
         symbols = []
-    cleaned_symbols = [str(symbol).strip().upper() for symbol in symbols if str(symbol).strip()]
+    cleaned_symbols = parse_symbols(",".join(str(symbol) for symbol in symbols))
     threshold = raw.get("threshold_percent", default_threshold)
     try:
         threshold_value = float(threshold)
@@ -90,17 +124,28 @@ def load_ui_config(default_threshold: float) -> UiConfig:
 
 
 def save_ui_config(config: UiConfig) -> None:
+    global _effective_cache
     UI_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
     payload = {
         "etf_symbols": config.etf_symbols,
         "threshold_percent": config.threshold_percent,
         "market_open_retry_seconds": config.market_open_retry_seconds,
     }
-    with UI_CONFIG_PATH.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    with UI_CONFIG_PATH.open("wb") as handle:
+        handle.write(jsonio.dumps(payload, indent=True))
+    with _json_cache_lock:
+        _json_cache.pop(UI_CONFIG_PATH, None)
+    _effective_cache = None
 
 
 def load_effective_config() -> EffectiveConfig:
+    """Return the merged config, reusing the last result while both files are unchanged."""
+    global _effective_cache
+    key = (OPTIONS_PATH, _stat_key(OPTIONS_PATH), UI_CONFIG_PATH, _stat_key(UI_CONFIG_PATH))
+    if _effective_cache is not None and _effective_cache[0] == key:
+        return _effective_cache[1]
     options = load_addon_options()
     ui = load_ui_config(options.default_threshold_percent)
-    return EffectiveConfig(options=options, ui=ui)
+    config = EffectiveConfig(options=options, ui=ui)
+    _effective_cache = (key, config)
+    return config
@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
-import csv
-import io
 import logging
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, time as dt_time, timedelta
 from email.utils import parsedate_to_datetime
+from types import MappingProxyType
 from typing import Callable, Iterable
 from zoneinfo import ZoneInfo
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ModuleNotFoundError:
+    requests = None
+
+from . import jsonio
 from .config import EffectiveConfig
 from .ha_client import HomeAssistantClient
-from .storage import MonitorState, load_state, save_state
+from .storage import MonitorState, MonitorStateSnapshot, load_state, save_state
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,13 +33,33 @@ Notifier = Callable[[str, str], None]
 _YAHOO_CRUMB_TTL_SECONDS = 1800
 _ALPHA_VANTAGE_MIN_DELAY_SECONDS = 15.0
 _YAHOO_MIN_DELAY_SECONDS = 15.0
+_YAHOO_RETRY_BASE_DELAY_SECONDS = 2.0
+_YAHOO_RETRY_MAX_DELAY_SECONDS = 60.0
 _STOOQ_MIN_DELAY_SECONDS = 15.0
 _FINNHUB_MIN_DELAY_SECONDS = 15.0
-_yahoo_session: "requests.Session | None" = None
+_YAHOO_BATCH_SIZE = 100
+_MIN_POLL_INTERVAL_SECONDS = 10.0
+_PRICE_CACHE_TTL_SECONDS = 45.0
+_YAHOO_ETAG_MAX_ENTRIES = 16
+_HTTP_POOL_CONNECTIONS = 4
+_JSON_HEADERS = {"User-Agent": "ETF-Checker/1.0", "Accept": "application/json"}
+_CSV_HEADERS = {"User-Agent": "ETF-Checker/1.0", "Accept": "text/csv"}
+_YAHOO_QUOTE_URLS = (
+    "https://query2.finance.yahoo.com/v7/finance/quote",
+    "https://query1.finance.yahoo.com/v7/finance/quote",
+)
+_YAHOO_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+_STOOQ_URL = "https://stooq.com/q/l/"
+_ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+_FINNHUB_URL = "https://finnhub.io/api/v1/quote"
+_HTTP_POOL_MAXSIZE = 16
+_http_session: "requests.Session | None" = None
+_yahoo_cookie_primed = False
 _yahoo_crumb: str | None = None
 _yahoo_crumb_timestamp: float | None = None
 _yahoo_cooldown_until: float | None = None
 _yahoo_last_call: float | None = None
+_yahoo_backoff_delay = _YAHOO_RETRY_BASE_DELAY_SECONDS
 _alpha_vantage_api_key: str | None = None
 _alpha_vantage_last_call: float | None = None
 _alpha_vantage_missing_key_logged = False
@@ -38,6 +67,11 @@ _finnhub_api_key: str | None = None
 _finnhub_last_call: float | None = None
 _finnhub_missing_key_logged = False
 _stooq_last_call: float | None = None
+_stooq_close_index: dict[str, int] = {}
+_price_cache: dict[tuple[str, ...], tuple[float, dict[str, float]]] = {}
+_price_cache_lock = threading.Lock()
+_yahoo_etags: dict[tuple[str, ...], tuple[str, dict[str, float]]] = {}
+_yahoo_etag_lock = threading.Lock()
 
 
 @dataclass(frozen=True, slots=True)
@@ -109,32 +143,6 @@ def _next_market_open_delay(symbols: list[str], now: datetime, retry_offset_seco
     return min(delays)
 
 
-def _retry_after_seconds(value: str | None) -> float | None:
-    if not value:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        pass
-    try:
-        parsed = parsedate_to_datetime(value)
-        if parsed is None:
-            return None
-        seconds = (parsed - parsed.now(parsed.tzinfo)).total_seconds()
-        return max(seconds, 0.0)
-    except (TypeError, ValueError, OverflowError):
-        return None
-
-
-def _sleep_for_retry_after(retry_after: str | None, fallback_delay: float, context: str) -> None:
-    delay = _retry_after_seconds(retry_after)
-    if delay is None:
-        delay = fallback_delay
-    _set_yahoo_cooldown(delay)
-    LOGGER.warning("Yahoo Finance rate limited (%s). Retrying in %.1fs.", context, delay)
-    time.sleep(delay)
-
-
 def _set_yahoo_cooldown(delay: float) -> None:
     global _yahoo_cooldown_until
     _yahoo_cooldown_until = time.monotonic() + max(delay, 0.0)
@@ -156,6 +164,13 @@ def set_finnhub_api_key(api_key: str) -> None:
     _finnhub_api_key = api_key.strip()
 
 
+def clear_price_cache() -> None:
+    with _price_cache_lock:
+        _price_cache.clear()
+    with _yahoo_etag_lock:
+        _yahoo_etags.clear()
+
+
 def _throttle_provider(last_call: float | None, min_delay: float) -> float:
     now = time.monotonic()
     if last_call is None:
@@ -211,60 +226,118 @@ def _sleep_for_retry_after(retry_after: str | None, fallback_delay: float, conte
     time.sleep(delay)
 
 
+def _get_http_session() -> "requests.Session":
+    """Return the keep-alive session shared by all price providers.
+
+    Connection errors and 5xx responses are retried by urllib3; HTTP 429 is left to the
+    provider code so Retry-After and the Yahoo cooldown keep working.
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        retries = Retry(
+            total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=_HTTP_POOL_CONNECTIONS, pool_maxsize=_HTTP_POOL_MAXSIZE, max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def _yahoo_get_with_retries(
+    session: "requests.Session",
+    url: str,
+    *,
+    params: dict[str, str] | None = None,
+    headers: dict[str, str],
+    timeout: float,
+    context: str,
+    max_attempts: int = 3,
+) -> "requests.Response":
+    """GET a Yahoo Finance URL, retrying HTTP 429 with jittered exponential backoff.
+
+    The backoff delay carries over between calls while Yahoo keeps rate limiting, and the
+    cooldown is armed when the last attempt is still rejected.
+    """
+    global _yahoo_backoff_delay
+    delay = _yahoo_backoff_delay
+    for attempt in range(max_attempts):
+        _yahoo_throttle()
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code != 429:
+            _yahoo_backoff_delay = _YAHOO_RETRY_BASE_DELAY_SECONDS
+            return response
+        if attempt < max_attempts - 1:
+            jittered = random.uniform(delay / 2, delay)
+            _sleep_for_retry_after(response.headers.get("Retry-After"), jittered, context)
+            delay = min(delay * 2, _YAHOO_RETRY_MAX_DELAY_SECONDS)
+    _yahoo_backoff_delay = delay
+    _set_yahoo_cooldown(_retry_after_seconds(response.headers.get("Retry-After")) or delay)
+    return response
+
+
+def _quote_price(value: object) -> float | None:
+    # JSON booleans are ints in Python, but never a price.
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_yahoo_quotes(content: bytes) -> dict[str, float]:
+    results = jsonio.loads(content).get("quoteResponse", {}).get("result", ())
+    return {
+        item["symbol"]: price
+        for item in results
+        if item.get("symbol") and (price := _quote_price(item.get("regularMarketPrice"))) is not None
+    }
+
+
 def _fetch_prices_batch(symbols: list[str]) -> dict[str, float]:
     cooldown = _yahoo_cooldown_remaining()
     if cooldown > 0:
         LOGGER.warning("Skipping Yahoo Finance (cooldown %.1fs remaining).", cooldown)
         return {}
-    urls = [
-        "https://query2.finance.yahoo.com/v7/finance/quote",
-        "https://query1.finance.yahoo.com/v7/finance/quote",
-    ]
-    headers = {"User-Agent": "ETF-Checker/1.0", "Accept": "application/json"}
+    # Revalidate with the last ETag so unchanged quotes (e.g. outside market hours) come back as 304.
+    etag_key = tuple(symbols)
+    with _yahoo_etag_lock:
+        cached = _yahoo_etags.get(etag_key)
+    headers = _JSON_HEADERS if cached is None else {**_JSON_HEADERS, "If-None-Match": cached[0]}
     try:
-        import requests
-
+        session = _get_http_session()
         params = {"symbols": ",".join(symbols)}
         last_error: Exception | None = None
-        for url in urls:
-            delay = 2.0
-            for attempt in range(3):
-                _yahoo_throttle()
-                response = requests.get(url, params=params, headers=headers, timeout=15)
-                if response.status_code == 429 and attempt < 2:
-                    _sleep_for_retry_after(response.headers.get("Retry-After"), delay, "quote")
-                    delay *= 2
-                    continue
-                if response.status_code == 401:
-                    last_error = requests.HTTPError("401 Unauthorized")
-                    break
-                if response.status_code == 429:
-                    cooldown = _retry_after_seconds(response.headers.get("Retry-After")) or delay
-                    _set_yahoo_cooldown(cooldown)
-                response.raise_for_status()
-                last_error = None
-                break
-            if last_error is None:
-                break
+        for url in _YAHOO_QUOTE_URLS:
+            response = _yahoo_get_with_retries(
+                session, url, params=params, headers=headers, timeout=15, context="quote"
+            )
+            if response.status_code == 401:
+                last_error = requests.HTTPError("401 Unauthorized")
+                continue
+            response.raise_for_status()
+            last_error = None
+            break
         if last_error is not None:
             raise last_error
-    except ModuleNotFoundError:
-        LOGGER.warning("requests is not installed; cannot fetch prices.")
-        return {}
     except requests.RequestException as err:
         LOGGER.warning("Yahoo Finance request failed: %s", err)
         return {}
-    payload = response.json()
-    results = payload.get("quoteResponse", {}).get("result", [])
-    prices: dict[str, float] = {}
-    for item in results:
-        symbol = str(item.get("symbol", "")).upper()
-        price = item.get("regularMarketPrice")
-        if symbol and price is not None:
-            try:
-                prices[symbol] = float(price)
-            except (TypeError, ValueError):
-                continue
+    if response.status_code == 304:
+        return dict(cached[1]) if cached is not None else {}
+    prices = _parse_yahoo_quotes(response.content)
+    etag = response.headers.get("ETag")
+    if etag and prices:
+        with _yahoo_etag_lock:
+            # Keys follow whatever was still missing this poll; keep only the most recent ones.
+            _yahoo_etags.pop(etag_key, None)
+            _yahoo_etags[etag_key] = (etag, dict(prices))
+            while len(_yahoo_etags) > _YAHOO_ETAG_MAX_ENTRIES:
+                del _yahoo_etags[next(iter(_yahoo_etags))]
     return prices
 
 
@@ -276,36 +349,19 @@ def _fetch_prices_yahoo_with_crumb(symbols: list[str]) -> dict[str, float]:
     if cooldown > 0:
         LOGGER.warning("Skipping Yahoo Finance crumb flow (cooldown %.1fs remaining).", cooldown)
         return {}
-    headers = {"User-Agent": "ETF-Checker/1.0", "Accept": "application/json"}
-    url = "https://query1.finance.yahoo.com/v7/finance/quote"
-    url_no_crumb = "https://query2.finance.yahoo.com/v7/finance/quote"
-    prices: dict[str, float] = {}
+    url_no_crumb, url = _YAHOO_QUOTE_URLS
     try:
-        import requests
-
-        global _yahoo_session
+        global _yahoo_cookie_primed
         global _yahoo_crumb
         global _yahoo_crumb_timestamp
-        if _yahoo_session is None:
-            _yahoo_session = requests.Session()
-            _yahoo_session.get("https://fc.yahoo.com", headers=headers, timeout=10)
-        session = _yahoo_session
+        session = _get_http_session()
+        if not _yahoo_cookie_primed:
+            session.get("https://fc.yahoo.com", headers=_JSON_HEADERS, timeout=10)
+            _yahoo_cookie_primed = True
         params = {"symbols": ",".join(symbols)}
-        response = None
-        delay = 2.0
-        for attempt in range(3):
-            _yahoo_throttle()
-            response = session.get(url_no_crumb, params=params, headers=headers, timeout=15)
-            if response.status_code == 429 and attempt < 2:
-                _sleep_for_retry_after(response.headers.get("Retry-After"), delay, "quote")
-                delay *= 2
-                continue
-            if response.status_code == 429:
-                cooldown = _retry_after_seconds(response.headers.get("Retry-After")) or delay
-                _set_yahoo_cooldown(cooldown)
-            break
-        if response is None:
-            return {}
+        response = _yahoo_get_with_retries(
+            session, url_no_crumb, params=params, headers=_JSON_HEADERS, timeout=15, context="quote"
+        )
         if response.status_code in {401, 429}:
             now = time.monotonic()
             if (
@@ -315,58 +371,65 @@ def _fetch_prices_yahoo_with_crumb(symbols: list[str]) -> dict[str, float]:
             ):
                 crumb = _yahoo_crumb
             else:
-                crumb = ""
-                delay = 2.0
-                for attempt in range(3):
-                    _yahoo_throttle()
-                    crumb_response = session.get(
-                        "https://query1.finance.yahoo.com/v1/test/getcrumb", headers=headers, timeout=10
-                    )
-                    if crumb_response.status_code == 429 and attempt < 2:
-                        _sleep_for_retry_after(crumb_response.headers.get("Retry-After"), delay, "crumb")
-                        delay *= 2
-                        continue
-                    if crumb_response.status_code == 429:
-                        cooldown = _retry_after_seconds(crumb_response.headers.get("Retry-After")) or delay
-                        _set_yahoo_cooldown(cooldown)
-                    crumb_response.raise_for_status()
-                    crumb = crumb_response.text.strip()
-                    break
+                crumb_response = _yahoo_get_with_retries(
+                    session,
+                    _YAHOO_CRUMB_URL,
+                    headers=_JSON_HEADERS,
+                    timeout=10,
+                    context="crumb",
+                )
+                crumb_response.raise_for_status()
+                crumb = crumb_response.text.strip()
                 if crumb:
                     _yahoo_crumb = crumb
                     _yahoo_crumb_timestamp = now
             if not crumb:
                 return {}
             params = {"symbols": ",".join(symbols), "crumb": crumb}
-            delay = 2.0
-            for attempt in range(3):
-                _yahoo_throttle()
-                response = session.get(url, params=params, headers=headers, timeout=15)
-                if response.status_code == 429 and attempt < 2:
-                    _sleep_for_retry_after(response.headers.get("Retry-After"), delay, "quote")
-                    delay *= 2
-                    continue
-                if response.status_code == 429:
-                    cooldown = _retry_after_seconds(response.headers.get("Retry-After")) or delay
-                    _set_yahoo_cooldown(cooldown)
-                break
+            response = _yahoo_get_with_retries(
+                session, url, params=params, headers=_JSON_HEADERS, timeout=15, context="quote"
+            )
         response.raise_for_status()
-    except ModuleNotFoundError:
-        LOGGER.warning("requests is not installed; cannot fetch crumb prices.")
-        return {}
     except requests.RequestException as err:
         LOGGER.warning("Yahoo Finance crumb request failed: %s", err)
         return {}
-    payload = response.json()
-    results = payload.get("quoteResponse", {}).get("result", [])
-    for item in results:
-        symbol = str(item.get("symbol", "")).upper()
-        price = item.get("regularMarketPrice")
-        if symbol and price is not None:
-            try:
-                prices[symbol] = float(price)
-            except (TypeError, ValueError):
-                continue
+    return _parse_yahoo_quotes(response.content)
+
+
+def _stooq_close_column(header_line: str) -> int | None:
+    close_idx = _stooq_close_index.get(header_line)
+    if close_idx is None:
+        try:
+            close_idx = header_line.split(",").index("Close")
+        except ValueError:
+            return None
+        _stooq_close_index[header_line] = close_idx
+    return close_idx
+
+
+def _parse_stooq_closes(bodies: Iterable[tuple[str, str]]) -> dict[str, float]:
+    """Extract Close prices from single-row Stooq CSV responses in one pass."""
+    prices: dict[str, float] = {}
+    header: str | None = None
+    close_idx: int | None = None
+    for symbol, text in bodies:
+        header_line, _, rest = text.partition("\n")
+        row_line = rest.partition("\n")[0].strip()
+        if not row_line:
+            continue
+        header_line = header_line.strip()
+        if header_line != header:
+            header = header_line
+            close_idx = _stooq_close_column(header_line)
+        if close_idx is None:
+            continue
+        fields = row_line.split(",")
+        if close_idx >= len(fields) or fields[close_idx] in ("", "N/A"):
+            continue
+        try:
+            prices[symbol.upper()] = float(fields[close_idx])
+        except ValueError:
+            continue
     return prices
 
 
@@ -374,35 +437,20 @@ def _fetch_prices_stooq(symbols: list[str]) -> dict[str, float]:
     """Fallback provider using Stooq CSV endpoint."""
     if not symbols:
         return {}
-    headers = {"User-Agent": "ETF-Checker/1.0", "Accept": "text/csv"}
-    url = "https://stooq.com/q/l/"
-    prices: dict[str, float] = {}
+    bodies: list[tuple[str, str]] = []
     try:
-        import requests
-
+        session = _get_http_session()
+        # Sequential on purpose: the throttle spaces requests 15s apart, so threads would not overlap.
         for symbol in symbols:
             _stooq_throttle()
             params = {"s": symbol.lower(), "f": "sd2t2ohlcv", "h": "", "e": "csv"}
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            response = session.get(_STOOQ_URL, params=params, headers=_CSV_HEADERS, timeout=15)
             response.raise_for_status()
-            reader = csv.DictReader(io.StringIO(response.text))
-            row = next(reader, None)
-            if not row:
-                continue
-            close_value = row.get("Close")
-            if close_value in (None, "", "N/A"):
-                continue
-            try:
-                prices[symbol.upper()] = float(close_value)
-            except (TypeError, ValueError):
-                continue
-    except ModuleNotFoundError:
-        LOGGER.warning("requests is not installed; cannot fetch fallback prices.")
-        return {}
+            bodies.append((symbol, response.text))
     except requests.RequestException as err:
         LOGGER.warning("Stooq request failed: %s", err)
         return {}
-    return prices
+    return _parse_stooq_closes(bodies)
 
 
 def _fetch_prices_alpha_vantage(symbols: list[str], api_key: str | None) -> dict[str, float]:
@@ -415,16 +463,13 @@ def _fetch_prices_alpha_vantage(symbols: list[str], api_key: str | None) -> dict
             LOGGER.warning("Alpha Vantage API key not configured; skipping Alpha Vantage provider.")
             _alpha_vantage_missing_key_logged = True
         return {}
-    url = "https://www.alphavantage.co/query"
-    headers = {"User-Agent": "ETF-Checker/1.0", "Accept": "application/json"}
     prices: dict[str, float] = {}
     try:
-        import requests
-
+        session = _get_http_session()
         for symbol in symbols:
             _alpha_vantage_throttle()
             params = {"function": "GLOBAL_QUOTE", "symbol": symbol, "apikey": api_key}
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            response = session.get(_ALPHA_VANTAGE_URL, params=params, headers=_JSON_HEADERS, timeout=15)
             if response.status_code == 429:
                 LOGGER.warning("Alpha Vantage rate limit hit (HTTP 429).")
                 break
@@ -444,9 +489,6 @@ def _fetch_prices_alpha_vantage(symbols: list[str], api_key: str | None) -> dict
                 prices[str(quote.get("01. symbol", symbol)).upper()] = float(price_value)
             except (TypeError, ValueError):
                 continue
-    except ModuleNotFoundError:
-        LOGGER.warning("requests is not installed; cannot fetch Alpha Vantage prices.")
-        return {}
     except requests.RequestException as err:
         LOGGER.warning("Alpha Vantage request failed: %s", err)
         return {}
@@ -463,16 +505,13 @@ def _fetch_prices_finnhub(symbols: list[str], api_key: str | None) -> dict[str,
             LOGGER.warning("Finnhub API key not configured; skipping Finnhub provider.")
             _finnhub_missing_key_logged = True
         return {}
-    url = "https://finnhub.io/api/v1/quote"
-    headers = {"User-Agent": "ETF-Checker/1.0", "Accept": "application/json"}
     prices: dict[str, float] = {}
     try:
-        import requests
-
+        session = _get_http_session()
         for symbol in symbols:
             _finnhub_throttle()
             params = {"symbol": symbol, "token": api_key}
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            response = session.get(_FINNHUB_URL, params=params, headers=_JSON_HEADERS, timeout=15)
             if response.status_code == 429:
                 LOGGER.warning("Finnhub rate limit hit (HTTP 429).")
                 break
@@ -485,9 +524,6 @@ def _fetch_prices_finnhub(symbols: list[str], api_key: str | None) -> dict[str,
                 prices[str(symbol).upper()] = float(price_value)
             except (TypeError, ValueError):
                 continue
-    except ModuleNotFoundError:
-        LOGGER.warning("requests is not installed; cannot fetch Finnhub prices.")
-        return {}
     except requests.RequestException as err:
         LOGGER.warning("Finnhub request failed: %s", err)
         return {}
@@ -520,48 +556,71 @@ def _fetch_prices_with_suffixes(
 def default_price_provider(symbols: Iterable[str]) -> dict[str, float]:
     """Fetch latest ETF prices using Alpha Vantage, Finnhub, Yahoo Finance, and fallbacks."""
 
-    symbol_list = [symbol.strip().upper() for symbol in symbols if symbol]
+    if requests is None:
+        LOGGER.warning("requests is not installed; cannot fetch prices.")
+        return {}
+    symbol_list = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol))
     if not symbol_list:
         return {}
+    cache_key = tuple(symbol_list)
+    with _price_cache_lock:
+        cached = _price_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _PRICE_CACHE_TTL_SECONDS:
+        LOGGER.debug("Using cached prices for symbols: %s", ", ".join(symbol_list))
+        return dict(cached[1])
     prices: dict[str, float] = {}
-    batch_size = 5
-    prices.update(_fetch_prices_alpha_vantage(symbol_list, _alpha_vantage_api_key))
-    missing = [symbol for symbol in symbol_list if symbol not in prices]
+    # Insertion-ordered set of symbols still lacking a price.
+    missing = dict.fromkeys(symbol_list)
+
+    def collect(fetched: dict[str, float]) -> None:
+        prices.update(fetched)
+        for symbol in fetched:
+            missing.pop(symbol, None)
+
+    warn = LOGGER.isEnabledFor(logging.WARNING)
+    collect(_fetch_prices_alpha_vantage(symbol_list, _alpha_vantage_api_key))
     if missing:
-        prices.update(_fetch_prices_finnhub(missing, _finnhub_api_key))
-    missing = [symbol for symbol in symbol_list if symbol not in prices]
-    for index in range(0, len(missing), batch_size):
-        batch = missing[index : index + batch_size]
-        prices.update(_fetch_prices_batch(batch))
-        if index + batch_size < len(missing):
-            time.sleep(0.5)
-    missing = [symbol for symbol in symbol_list if symbol not in prices]
+        collect(_fetch_prices_finnhub(list(missing), _finnhub_api_key))
+    pending = list(missing)
+    # The quote endpoint silently truncates long symbol lists, so cap each request.
+    # Chunks go out one by one: the Yahoo throttle spaces requests 15s apart anyway.
+    for index in range(0, len(pending), _YAHOO_BATCH_SIZE):
+        collect(_fetch_prices_batch(pending[index : index + _YAHOO_BATCH_SIZE]))
     if missing:
-        LOGGER.warning("Attempting Yahoo Finance crumb fallback for symbols: %s", ", ".join(missing))
-        prices.update(_fetch_prices_yahoo_with_crumb(missing))
-        missing = [symbol for symbol in symbol_list if symbol not in prices]
+        if warn:
+            LOGGER.warning("Attempting Yahoo Finance crumb fallback for symbols: %s", ", ".join(missing))
+        collect(_fetch_prices_yahoo_with_crumb(list(missing)))
     if missing:
-        LOGGER.warning("Attempting Stooq fallback for symbols: %s", ", ".join(missing))
-        prices.update(_fetch_prices_stooq(missing))
-        missing = [symbol for symbol in symbol_list if symbol not in prices]
+        if warn:
+            LOGGER.warning("Attempting Stooq fallback for symbols: %s", ", ".join(missing))
+        collect(_fetch_prices_stooq(list(missing)))
     if missing:
         suffixes = [".MI", ".DE", ".PA", ".L"]
-        LOGGER.warning(
-            "Attempting suffix fallback for symbols: %s (suffixes: %s)",
-            ", ".join(missing),
-            ", ".join(suffixes),
-        )
-        prices.update(_fetch_prices_with_suffixes(missing, suffixes, _fetch_prices_stooq))
-        missing = [symbol for symbol in symbol_list if symbol not in prices]
-    if missing:
+        if warn:
+            LOGGER.warning(
+                "Attempting suffix fallback for symbols: %s (suffixes: %s)",
+                ", ".join(missing),
+                ", ".join(suffixes),
+            )
+        collect(_fetch_prices_with_suffixes(list(missing), suffixes, _fetch_prices_stooq))
+    if missing and warn:
         LOGGER.warning("No prices returned for symbols: %s", ", ".join(missing))
+    if prices:
+        now = time.monotonic()
+        with _price_cache_lock:
+            for key, (stored_at, _) in list(_price_cache.items()):
+                if now - stored_at >= _PRICE_CACHE_TTL_SECONDS:
+                    del _price_cache[key]
+            _price_cache[cache_key] = (now, dict(prices))
     return prices
 
 
+def _normalize_symbols(symbols: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+
+
 def percent_change(reference: float, current: float) -> float:
-    if reference == 0:
-        return 0.0
-    return ((current - reference) / reference) * 100.0
+    return 0.0 if not reference else (current - reference) * (100.0 / reference)
 
 
 @dataclass(slots=True)
@@ -569,61 +628,121 @@ class MonitorDependencies:
     price_provider: PriceProvider = default_price_provider
 
 
+def _build_ha_client(config: EffectiveConfig) -> HomeAssistantClient:
+    return HomeAssistantClient(
+        base_url=config.options.homeassistant_url.rstrip("/"),
+        token=config.options.homeassistant_token,
+        notify_service=config.options.notify_service,
+    )
+
+
 class EtfMonitor:
     """Background monitor that checks ETF changes and sends notifications."""
 
     def __init__(self, config: EffectiveConfig, dependencies: MonitorDependencies | None = None) -> None:
         self._config = config
+        self._symbols = _normalize_symbols(config.ui.etf_symbols)
         self._deps = dependencies or MonitorDependencies()
         self._state: MonitorState = load_state()
-        self._lock = threading.Lock()
+        self._state_version = 0
+        self._state_dirty = False
+        self._snapshot: tuple[int, MonitorStateSnapshot] | None = None
+        # _config_lock guards _config/_ha_client; _state_lock guards _state and its snapshot.
+        self._config_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._save_lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._last_run_monotonic: float | None = None
+        self._poll_running = False
         self._thread: threading.Thread | None = None
+        self._notify_pool: ThreadPoolExecutor | None = None
         set_alpha_vantage_api_key(config.options.alpha_vantage_api_key)
         set_finnhub_api_key(config.options.finnhub_api_key)
-        self._ha_client = HomeAssistantClient(
-            base_url=config.options.homeassistant_url.rstrip("/"),
-            token=config.options.homeassistant_token,
-            notify_service=config.options.notify_service,
-        )
+        self._ha_client = _build_ha_client(config)
 
     @property
-    def state(self) -> MonitorState:
-        with self._lock:
-            return MonitorState(
-                baselines=dict(self._state.baselines),
-                last_baseline_update=self._state.last_baseline_update,
-            )
+    def state(self) -> MonitorStateSnapshot:
+        """Read-only snapshot of the state, rebuilt only after baselines change.
+
+        The snapshot is shared between callers, so its baselines are a read-only mapping.
+        """
+        with self._state_lock:
+            if self._snapshot is None or self._snapshot[0] != self._state_version:
+                self._snapshot = (
+                    self._state_version,
+                    MonitorStateSnapshot(
+                        baselines=MappingProxyType(dict(self._state.baselines)),
+                        last_baseline_update=self._state.last_baseline_update,
+                    ),
+                )
+            return self._snapshot[1]
 
     def update_config(self, config: EffectiveConfig) -> None:
-        with self._lock:
+        with self._config_lock:
+            if config.ui.etf_symbols != self._config.ui.etf_symbols:
+                clear_price_cache()
             self._config = config
+            self._symbols = _normalize_symbols(config.ui.etf_symbols)
             set_alpha_vantage_api_key(config.options.alpha_vantage_api_key)
             set_finnhub_api_key(config.options.finnhub_api_key)
-            self._ha_client = HomeAssistantClient(
-                base_url=config.options.homeassistant_url.rstrip("/"),
-                token=config.options.homeassistant_token,
-                notify_service=config.options.notify_service,
-            )
+            # Keep the current client (and its precomputed request data) unless its settings changed.
+            client = _build_ha_client(config)
+            if client != self._ha_client:
+                self._ha_client = client
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
         self._stop_event.clear()
+        self._wake_event.clear()
         self._thread = threading.Thread(target=self._run_loop, name="etf-monitor", daemon=True)
         self._thread.start()
         LOGGER.info("ETF monitor started.")
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wake_event.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
+        pool, self._notify_pool = self._notify_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
         LOGGER.info("ETF monitor stopped.")
 
+    def request_poll(self, force: bool = False) -> str:
+        """Wake the background loop for an early poll.
+
+        Returns "scheduled", or why the request was dropped: "stopped" when the loop is not
+        running and, unless forced, "running" or "recent" when a poll is in progress or
+        finished moments ago.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            LOGGER.warning("ETF monitor is not running; poll not scheduled.")
+            return "stopped"
+        if not force:
+            if self._poll_running:
+                return "running"
+            last_run = self._last_run_monotonic
+            if last_run is not None and time.monotonic() - last_run < _MIN_POLL_INTERVAL_SECONDS:
+                return "recent"
+        self._wake_event.set()
+        return "scheduled"
+
     def run_once(self) -> float | None:
-        with self._lock:
+        self._poll_running = True
+        try:
+            return self._poll()
+        finally:
+            # Stamp the end of the run: provider throttles can keep a poll busy for minutes.
+            self._last_run_monotonic = time.monotonic()
+            self._poll_running = False
+
+    def _poll(self) -> float | None:
+        with self._config_lock:
             config = self._config
-            symbols = list(dict.fromkeys(config.ui.etf_symbols))
+            ha_client = self._ha_client
+            symbols = self._symbols
             threshold = config.ui.threshold_percent
             retry_after_open = config.ui.market_open_retry_seconds
         if not symbols:
@@ -648,45 +767,85 @@ class EtfMonitor:
             return None
         alerts: list[tuple[str, float, float, float]] = []
         baseline_updated = False
-        with self._lock:
+        with self._state_lock:
+            baselines = self._state.baselines
             for symbol, current_price in prices.items():
-                baseline = self._state.baselines.get(symbol)
+                baseline = baselines.get(symbol)
                 if baseline is None:
-                    self._state.baselines[symbol] = current_price
+                    baselines[symbol] = current_price
                     baseline_updated = True
                     continue
                 change = percent_change(baseline, current_price)
                 if abs(change) >= threshold:
                     alerts.append((symbol, baseline, current_price, change))
-                    self._state.baselines[symbol] = current_price
+                    baselines[symbol] = current_price
                     baseline_updated = True
             if baseline_updated:
                 self._state.last_baseline_update = now.isoformat(timespec="seconds")
-            save_state(self._state)
-        for symbol, baseline, current_price, change in alerts:
-            self._notify(symbol, baseline, current_price, change, threshold)
+                self._state_version += 1
+                self._state_dirty = True
+        self._save_state()
+        if alerts:
+            # Each alert is a separate HTTPS POST; send them concurrently and wait for all.
+            pool = self._notify_pool
+            if pool is None:
+                pool = self._notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="etf-notify")
+            list(pool.map(lambda alert: self._notify(ha_client, *alert, threshold), alerts))
         return None
 
-    def _notify(self, symbol: str, baseline: float, current_price: float, change: float, threshold: float) -> None:
+    def _save_state(self) -> None:
+        # Snapshot under the state lock, write outside it; the save lock keeps writes ordered.
+        with self._save_lock:
+            with self._state_lock:
+                if not self._state_dirty:
+                    return
+                snapshot = MonitorState(
+                    baselines=dict(self._state.baselines),
+                    last_baseline_update=self._state.last_baseline_update,
+                )
+                self._state_dirty = False
+            try:
+                save_state(snapshot)
+            except Exception:
+                with self._state_lock:
+                    self._state_dirty = True
+                raise
+
+    def _notify(
+        self,
+        ha_client: HomeAssistantClient,
+        symbol: str,
+        baseline: float,
+        current_price: float,
+        change: float,
+        threshold: float,
+    ) -> None:
         direction = "salito" if change > 0 else "sceso"
         title = f"ETF {symbol} {direction}"
         message = (
             f"{symbol} è {direction} del {change:.2f}% (soglia {threshold:.2f}%). "
             f"Baseline: {baseline:.2f}, attuale: {current_price:.2f}."
         )
-        if not self._ha_client.is_configured():
+        if not ha_client.is_configured():
             LOGGER.warning("Home Assistant client non configurato; alert non inviato: %s", message)
             return
         try:
-            self._ha_client.send_notification(title=title, message=message)
+            ha_client.send_notification(title=title, message=message)
             LOGGER.info("Alert inviato per %s: %s", symbol, message)
         except Exception as err:  # noqa: BLE001
             LOGGER.exception("Invio alert fallito per %s: %s", symbol, err)
 
     def _run_loop(self) -> None:
         while not self._stop_event.is_set():
-            override_delay = self.run_once()
-            with self._lock:
+            try:
+                override_delay = self.run_once()
+            except Exception as err:  # noqa: BLE001
+                # The loop is the only poller; never let one failed run end it.
+                LOGGER.exception("ETF poll failed: %s", err)
+                override_delay = None
+            with self._config_lock:
                 interval = max(self._config.options.poll_interval_seconds, 60)
             sleep_for = override_delay if override_delay is not None else interval
-            self._stop_event.wait(sleep_for)
+            # request_poll() and stop() set the wake event to cut the sleep short.
+            self._wake_event.wait(sleep_for)
+            self._wake_event.clear()
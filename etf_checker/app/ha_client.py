@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    import requests
 
 
 @dataclass(slots=True)
@@ -14,6 +18,17 @@ class HomeAssistantClient:
     token: str
     notify_service: str
     timeout_seconds: int = 15
+    _url: str = field(default="", init=False, repr=False, compare=False)
+    _headers: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    _session: ClassVar["requests.Session | None"] = None
+    _session_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __post_init__(self) -> None:
+        self._headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        }
 
     def is_configured(self) -> bool:
         return bool(self.base_url and self.token and self.notify_service)
@@ -21,20 +36,36 @@ class HomeAssistantClient:
     def send_notification(self, title: str, message: str, data: dict[str, Any] | None = None) -> None:
         if not self.is_configured():
             raise RuntimeError("Home Assistant client is not fully configured.")
-        import requests
-
-        domain, service = self._split_service(self.notify_service)
-        url = f"{self.base_url}/api/services/{domain}/{service}"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
         payload: dict[str, Any] = {"title": title, "message": message}
         if data:
             payload["data"] = data
-        response = requests.post(url, json=payload, headers=headers, timeout=self.timeout_seconds)
+        response = self._get_session().post(
+            self._service_url(), json=payload, headers=self._headers, timeout=self.timeout_seconds
+        )
         response.raise_for_status()
 
+    def _service_url(self) -> str:
+        # Resolved on first use so an invalid notify_service only fails when sending.
+        if not self._url:
+            domain, service = self._split_service(self.notify_service)
+            self._url = f"{self.base_url}/api/services/{domain}/{service}"
+        return self._url
+
+    @classmethod
+    def _get_session(cls) -> "requests.Session":
+        # Notification threads can race here on the first alert burst; build a single session.
+        with cls._session_lock:
+            if cls._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session = session
+            return cls._session
+
     @staticmethod
     def _split_service(service: str) -> tuple[str, str]:
         if "/" in service:
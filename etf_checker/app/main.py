@@ -2,29 +2,49 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import platform
 import sys
+import threading
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from flask import Flask, jsonify, redirect, render_template, request, url_for
+from flask.json.provider import JSONProvider
 
-from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from .config import EffectiveConfig, UiConfig, load_effective_config, save_ui_config
+from . import jsonio
+from .config import EffectiveConfig, UiConfig, load_effective_config, parse_symbols, save_ui_config
 from .etf_monitor import EtfMonitor
+from .storage import MonitorStateSnapshot
 
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
 LOGGER = logging.getLogger(__name__)
 
+_Number = TypeVar("_Number", int, float)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return jsonio.dumps(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return jsonio.loads(s)
+
+
 APP = Flask(__name__)
+APP.json = OrjsonProvider(APP)
 MONITOR = EtfMonitor(load_effective_config())
 MONITOR.start()
 
+_index_context: tuple[EffectiveConfig, MonitorStateSnapshot, dict[str, Any]] | None = None
+
 
 def _ingress_root() -> str:
     return os.environ.get("SUPERVISOR_INGRESS", "").rstrip("/")
@@ -38,10 +58,15 @@ def _redact_token(token: str) -> str:
     return f"{token[:4]}...{token[-4:]}"
 
 
+@functools.cache
+def _platform_description() -> str:
+    return platform.platform()
+
+
 def _log_startup_diagnostics() -> None:
     if not LOGGER.isEnabledFor(logging.DEBUG):
         return
-    LOGGER.debug("Runtime: python=%s platform=%s", sys.version.replace("\n", " "), platform.platform())
+    LOGGER.debug("Runtime: python=%s platform=%s", sys.version.replace("\n", " "), _platform_description())
     LOGGER.debug("Runtime: uid=%s gid=%s cwd=%s", os.getuid(), os.getgid(), os.getcwd())
     config = load_effective_config()
     options = config.options
@@ -57,11 +82,18 @@ def _log_startup_diagnostics() -> None:
     LOGGER.debug("UI config: symbols=%s", ", ".join(ui.etf_symbols) if ui.etf_symbols else "<none>")
     LOGGER.debug("UI config: threshold_percent=%s", ui.threshold_percent)
     LOGGER.debug("UI config: market_open_retry_seconds=%s", ui.market_open_retry_seconds)
-    data_path = Path("/data")
-    LOGGER.debug("Data path exists: %s", data_path.exists())
-    LOGGER.debug("Options file exists: %s", Path("/data/options.json").exists())
-    LOGGER.debug("UI config file exists: %s", Path("/data/ui_config.json").exists())
-    LOGGER.debug("State file exists: %s", Path("/data/monitor_state.json").exists())
+    # One directory listing instead of a stat per file.
+    try:
+        with os.scandir("/data") as entries:
+            data_files = {entry.name for entry in entries}
+        data_path_exists = True
+    except OSError:
+        data_files = set()
+        data_path_exists = False
+    LOGGER.debug("Data path exists: %s", data_path_exists)
+    LOGGER.debug("Options file exists: %s", "options.json" in data_files)
+    LOGGER.debug("UI config file exists: %s", "ui_config.json" in data_files)
+    LOGGER.debug("State file exists: %s", "monitor_state.json" in data_files)
 
 
 def _install_exception_logging() -> None:
@@ -71,14 +103,16 @@ def _install_exception_logging() -> None:
     sys.excepthook = _log_exception
 
 
-def _merge_config(ui_config: UiConfig) -> EffectiveConfig:
-    current = load_effective_config()
+def _merge_config(current: EffectiveConfig, ui_config: UiConfig) -> EffectiveConfig:
     return EffectiveConfig(options=current.options, ui=ui_config)
 
 
-def _parse_symbols(raw_symbols: str) -> list[str]:
-    symbols = [item.strip().upper() for item in raw_symbols.split(",")]
-    return [symbol for symbol in symbols if symbol]
+def _coerce(value: Any, cast: Callable[[Any], _Number], default: _Number, minimum: _Number) -> _Number:
+    """Cast a request value, falling back to ``default`` when missing or invalid, then clamp."""
+    try:
+        return max(cast(value), minimum)
+    except (TypeError, ValueError):
+        return max(default, minimum)
 
 
 def _format_baseline_update(value: str | None) -> str | None:
@@ -95,26 +129,34 @@ def _format_baseline_update(value: str | None) -> str | None:
     return parsed.strftime("%Y-%m-%d %H:%M:%S CET")
 
 
-@APP.route("/")
-def index() -> str:
-    config = load_effective_config()
-    state = MONITOR.state
+def _index_template_context(config: EffectiveConfig, state: MonitorStateSnapshot) -> dict[str, Any]:
+    # Config and state snapshots are reused until they change, so identity is a valid cache key.
+    global _index_context
+    cached = _index_context
+    if cached is not None and cached[0] is config and cached[1] is state:
+        return cached[2]
     baselines = {
         symbol: state.baselines.get(symbol)
         for symbol in config.ui.etf_symbols
         if symbol in state.baselines
     }
-    return render_template(
-        "index.html",
-        ingress_root=_ingress_root(),
-        symbols=", ".join(config.ui.etf_symbols),
-        threshold=config.ui.threshold_percent,
-        market_open_retry_seconds=config.ui.market_open_retry_seconds,
-        poll_interval=config.options.poll_interval_seconds,
-        notify_service=config.options.notify_service,
-        baselines=baselines,
-        last_baseline_update=_format_baseline_update(state.last_baseline_update),
-    )
+    context = {
+        "symbols": ", ".join(config.ui.etf_symbols),
+        "threshold": config.ui.threshold_percent,
+        "market_open_retry_seconds": config.ui.market_open_retry_seconds,
+        "poll_interval": config.options.poll_interval_seconds,
+        "notify_service": config.options.notify_service,
+        "baselines": baselines,
+        "last_baseline_update": _format_baseline_update(state.last_baseline_update),
+    }
+    _index_context = (config, state, context)
+    return context
+
+
+@APP.route("/")
+def index() -> str:
+    context = _index_template_context(load_effective_config(), MONITOR.state)
+    return render_template("index.html", ingress_root=_ingress_root(), **context)
 
 
 @APP.get("/api/config")
@@ -127,7 +169,7 @@ def get_config() -> Any:
         "market_open_retry_seconds": config.ui.market_open_retry_seconds,
         "poll_interval_seconds": config.options.poll_interval_seconds,
         "notify_service": config.options.notify_service,
-        "baselines": state.baselines,
+        "baselines": dict(state.baselines),
         "last_baseline_update": state.last_baseline_update,
     }
     return jsonify(payload)
@@ -136,28 +178,21 @@ def get_config() -> Any:
 @APP.post("/api/config")
 def update_config() -> Any:
     data = request.get_json(silent=True) or {}
-    raw_symbols = str(data.get("etf_symbols", ""))
-    symbols = _parse_symbols(raw_symbols)
-    threshold_raw = data.get("threshold_percent")
-    try:
-        threshold = float(threshold_raw)
-    except (TypeError, ValueError):
-        threshold = load_effective_config().options.default_threshold_percent
-    threshold = max(threshold, 0.1)
-    retry_raw = data.get("market_open_retry_seconds", load_effective_config().ui.market_open_retry_seconds)
-    try:
-        retry_after_open = int(retry_raw)
-    except (TypeError, ValueError):
-        retry_after_open = load_effective_config().ui.market_open_retry_seconds
-    retry_after_open = max(retry_after_open, 0)
+    current = load_effective_config()
+    symbols = parse_symbols(str(data.get("etf_symbols", "")))
+    threshold = _coerce(data.get("threshold_percent"), float, current.options.default_threshold_percent, 0.1)
+    retry_after_open = _coerce(
+        data.get("market_open_retry_seconds"), int, current.ui.market_open_retry_seconds, 0
+    )
     ui_config = UiConfig(
         etf_symbols=symbols,
         threshold_percent=threshold,
         market_open_retry_seconds=retry_after_open,
     )
     save_ui_config(ui_config)
-    MONITOR.update_config(_merge_config(ui_config))
-    MONITOR.run_once()
+    MONITOR.update_config(_merge_config(current, ui_config))
+    # A new config always deserves a fresh poll, even right after the previous one.
+    MONITOR.request_poll(force=True)
     return jsonify(
         {
             "status": "ok",
@@ -170,8 +205,8 @@ def update_config() -> Any:
 
 @APP.post("/api/poll")
 def trigger_poll() -> Any:
-    MONITOR.run_once()
-    return jsonify({"status": "ok"})
+    outcome = MONITOR.request_poll()
+    return jsonify({"status": "accepted", "scheduled": outcome == "scheduled", "reason": outcome}), 202
 
 
 @APP.route("/health")
@@ -192,11 +227,15 @@ def main() -> None:
     ingress_entry = _ingress_root()
     _install_exception_logging()
     LOGGER.info("Starting ETF Checker on port %s (ingress root: %s)", port, ingress_entry or "-")
-    _log_startup_diagnostics()
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        # Diagnostics touch the disk; run them alongside server startup instead of before it.
+        threading.Thread(target=_log_startup_diagnostics, name="etf-diagnostics", daemon=True).start()
     try:
-        APP.run(host="0.0.0.0", port=port, debug=False)
+        from waitress import serve
+
+        serve(APP, host="0.0.0.0", port=port, threads=8, connection_limit=100, channel_timeout=30)
     except Exception:  # noqa: BLE001
-        LOGGER.exception("Flask server failed to start")
+        LOGGER.exception("WSGI server failed to start")
         raise
 
 
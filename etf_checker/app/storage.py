@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+
+from . import jsonio
 
 STATE_PATH = Path("/data/monitor_state.json")
 
@@ -16,11 +18,19 @@ class MonitorState:
     last_baseline_update: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class MonitorStateSnapshot:
+    """Read-only view of a MonitorState shared between readers; copy it before serializing."""
+
+    baselines: Mapping[str, float]
+    last_baseline_update: str | None = None
+
+
 def _load_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with path.open("rb") as handle:
+        return jsonio.loads(handle.read())
 
 
 def load_state() -> MonitorState:
@@ -45,5 +55,10 @@ def save_state(state: MonitorState) -> None:
         "baselines": state.baselines,
         "last_baseline_update": state.last_baseline_update,
     }
-    with STATE_PATH.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    # Write to a sibling file and swap it in, so a crash mid-write never leaves a truncated state.
+    tmp_path = STATE_PATH.with_suffix(".json.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(jsonio.dumps(payload))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, STATE_PATH)
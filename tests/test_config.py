@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.config import UiConfig, load_effective_config, parse_symbols, save_ui_config
+
+
+def test_effective_config_is_cached_until_ui_config_is_saved(monkeypatch, tmp_path: Path) -> None:
+    options_path = tmp_path / "options.json"
+    options_path.write_text('{"default_threshold_percent": 3.0, "poll_interval_seconds": 300}', encoding="utf-8")
+    monkeypatch.setattr("app.config.OPTIONS_PATH", options_path)
+    monkeypatch.setattr("app.config.UI_CONFIG_PATH", tmp_path / "ui_config.json")
+    monkeypatch.setattr("app.config._effective_cache", None)
+
+    first = load_effective_config()
+    assert load_effective_config() is first
+    assert first.ui.threshold_percent == 3.0
+
+    save_ui_config(UiConfig(etf_symbols=["SWDA.MI"], threshold_percent=4.0, market_open_retry_seconds=30))
+    updated = load_effective_config()
+    assert updated is not first
+    assert updated.ui.etf_symbols == ["SWDA.MI"]
+    assert updated.ui.threshold_percent == 4.0
+
+
+def test_parse_symbols_normalizes_and_drops_empty_entries() -> None:
+    assert parse_symbols(" swda.mi, ,CSPX.MI,, eunl.de ") == ["SWDA.MI", "CSPX.MI", "EUNL.DE"]
+    assert parse_symbols("") == []
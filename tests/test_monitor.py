@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 
+from app import etf_monitor
 from app.config import AddonOptions, EffectiveConfig, UiConfig
-from app.etf_monitor import EtfMonitor, MonitorDependencies, percent_change
+from app.etf_monitor import (
+    EtfMonitor,
+    MonitorDependencies,
+    _fetch_prices_batch,
+    _fetch_prices_stooq,
+    _parse_stooq_closes,
+    _parse_yahoo_quotes,
+    _yahoo_cooldown_remaining,
+    _yahoo_get_with_retries,
+    clear_price_cache,
+    percent_change,
+)
 
 
 def test_percent_change_handles_growth_and_zero_reference() -> None:
@@ -11,6 +25,120 @@ def test_percent_change_handles_growth_and_zero_reference() -> None:
     assert percent_change(0.0, 110.0) == 0.0
 
 
+def test_parse_stooq_closes_reads_close_column() -> None:
+    header = "Symbol,Date,Time,Open,High,Low,Close,Volume\r\n"
+    bodies = [
+        ("SWDA.MI", header + "SWDA.MI,2024-05-02,17:35:00,90.1,91.2,89.9,90.75,1200\r\n"),
+        ("CSPX.MI", header + "CSPX.MI,N/D,N/D,N/D,N/D,N/D,N/D,N/D\r\n"),
+        ("EUNL.DE", header),
+    ]
+    assert _parse_stooq_closes(bodies) == {"SWDA.MI": 90.75}
+
+
+def test_fetch_prices_stooq_stops_at_first_error(monkeypatch) -> None:
+    import requests
+
+    calls: list[str] = []
+
+    class FailingSession:
+        def get(self, url, params=None, headers=None, timeout=None):  # noqa: ANN001
+            calls.append(params["s"])
+            raise requests.ConnectionError("host down")
+
+    monkeypatch.setattr("app.etf_monitor._http_session", FailingSession())
+    monkeypatch.setattr("app.etf_monitor._STOOQ_MIN_DELAY_SECONDS", 0.0)
+
+    assert _fetch_prices_stooq([f"ETF{index}.MI" for index in range(8)]) == {}
+    assert calls == ["etf0.mi"]
+
+
+def test_parse_yahoo_quotes_converts_prices_and_skips_invalid_rows() -> None:
+    content = (
+        b'{"quoteResponse": {"result": ['
+        b'{"symbol": "SWDA.MI", "regularMarketPrice": 90.5},'
+        b'{"symbol": "CSPX.MI", "regularMarketPrice": 512},'
+        b'{"symbol": "EUNL.DE"},'
+        b'{"symbol": "VWCE.DE", "regularMarketPrice": "110.25"},'
+        b'{"symbol": "IWDA.AS", "regularMarketPrice": true},'
+        b'{"symbol": "XDWD.DE", "regularMarketPrice": "N/A"}'
+        b"]}}"
+    )
+    assert _parse_yahoo_quotes(content) == {"SWDA.MI": 90.5, "CSPX.MI": 512.0, "VWCE.DE": 110.25}
+
+
+def test_fetch_prices_batch_reuses_prices_on_not_modified(monkeypatch) -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int, content: bytes = b"", headers=None) -> None:  # noqa: ANN001
+            self.status_code = status_code
+            self.content = content
+            self.headers = headers or {}
+
+        def raise_for_status(self) -> None:
+            pass
+
+    sent_headers: list[dict[str, str]] = []
+    responses = [
+        FakeResponse(
+            200,
+            b'{"quoteResponse": {"result": [{"symbol": "SWDA.MI", "regularMarketPrice": 90.5}]}}',
+            {"ETag": '"v1"'},
+        ),
+        FakeResponse(304),
+    ]
+
+    class FakeSession:
+        def get(self, url, params=None, headers=None, timeout=None):  # noqa: ANN001
+            sent_headers.append(headers)
+            return responses.pop(0)
+
+    monkeypatch.setattr("app.etf_monitor._http_session", FakeSession())
+    monkeypatch.setattr("app.etf_monitor._YAHOO_MIN_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr("app.etf_monitor._yahoo_etags", {})
+
+    assert _fetch_prices_batch(["SWDA.MI"]) == {"SWDA.MI": 90.5}
+    assert _fetch_prices_batch(["SWDA.MI"]) == {"SWDA.MI": 90.5}
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+
+    clear_price_cache()
+    assert etf_monitor._yahoo_etags == {}
+
+
+def test_yahoo_get_with_retries_carries_backoff_until_success(monkeypatch) -> None:
+    class FakeResponse:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+            self.headers: dict[str, str] = {}
+
+    statuses = [429, 429, 429, 429, 429, 200]
+
+    class FakeSession:
+        def get(self, url, params=None, headers=None, timeout=None):  # noqa: ANN001
+            return FakeResponse(statuses.pop(0))
+
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.etf_monitor.time.sleep", sleeps.append)
+    monkeypatch.setattr("app.etf_monitor.random.uniform", lambda low, high: high)
+    monkeypatch.setattr("app.etf_monitor._YAHOO_MIN_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr("app.etf_monitor._yahoo_backoff_delay", 2.0)
+    monkeypatch.setattr("app.etf_monitor._yahoo_cooldown_until", None)
+
+    def get() -> int:
+        response = _yahoo_get_with_retries(
+            FakeSession(), "https://example.invalid", headers={}, timeout=1, context="test"
+        )
+        return response.status_code
+
+    assert get() == 429
+    assert sleeps == [2.0, 4.0]
+    assert _yahoo_cooldown_remaining() > 0
+    assert etf_monitor._yahoo_backoff_delay == 8.0
+
+    assert get() == 200
+    assert sleeps == [2.0, 4.0, 8.0, 16.0]
+    assert etf_monitor._yahoo_backoff_delay == 2.0
+
+
 def test_monitor_triggers_alert_and_resets_baseline(monkeypatch, tmp_path: Path) -> None:
     state_path = tmp_path / "monitor_state.json"
     monkeypatch.setattr("app.storage.STATE_PATH", state_path)
@@ -39,19 +167,153 @@ def test_monitor_triggers_alert_and_resets_baseline(monkeypatch, tmp_path: Path)
             poll_interval_seconds=300,
             default_threshold_percent=2.0,
         ),
-        ui=UiConfig(etf_symbols=["SWDA.MI"], threshold_percent=2.0),
+        ui=UiConfig(etf_symbols=["SWDA.MI"], threshold_percent=2.0, market_open_retry_seconds=60),
     )
 
     monitor = EtfMonitor(config, dependencies=MonitorDependencies(price_provider=fake_price_provider))
 
     monitor.run_once()
     assert sent_messages == []
+    snapshot = monitor.state
+    assert monitor.state is snapshot
 
     monitor.run_once()
     assert len(sent_messages) == 1
+    assert monitor.state is not snapshot
+    assert monitor.state.baselines == {"SWDA.MI": 103.0}
 
     monitor.run_once()
     assert len(sent_messages) == 2
 
     saved_state = state_path.read_text(encoding="utf-8")
     assert "SWDA.MI" in saved_state
+
+
+def _make_config(symbols: list[str]) -> EffectiveConfig:
+    return EffectiveConfig(
+        options=AddonOptions(
+            homeassistant_url="http://homeassistant.local:8123",
+            homeassistant_token="token",
+            notify_service="notify/mobile_app_phone",
+            poll_interval_seconds=300,
+            default_threshold_percent=2.0,
+        ),
+        ui=UiConfig(etf_symbols=symbols, threshold_percent=2.0, market_open_retry_seconds=60),
+    )
+
+
+def test_run_loop_survives_failed_poll(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("app.storage.STATE_PATH", tmp_path / "monitor_state.json")
+    saves: list[dict[str, float]] = []
+    attempted = threading.Event()
+    saved = threading.Event()
+
+    def flaky_save_state(state) -> None:  # noqa: ANN001
+        if not attempted.is_set():
+            attempted.set()
+            raise OSError("disk full")
+        saves.append(dict(state.baselines))
+        saved.set()
+
+    monkeypatch.setattr("app.etf_monitor.save_state", flaky_save_state)
+    monitor = EtfMonitor(
+        _make_config(["SWDA.MI"]),
+        dependencies=MonitorDependencies(price_provider=lambda symbols: {"SWDA.MI": 100.0}),
+    )
+    assert monitor.request_poll() == "stopped"
+
+    monitor.start()
+    try:
+        assert attempted.wait(5)
+        assert monitor.request_poll(force=True) == "scheduled"
+        assert saved.wait(5)
+    finally:
+        monitor.stop()
+
+    assert saves == [{"SWDA.MI": 100.0}]
+    assert monitor.request_poll() == "stopped"
+
+
+def test_request_poll_collapses_while_running_and_stop_wakes_loop(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("app.storage.STATE_PATH", tmp_path / "monitor_state.json")
+    calls: list[float] = []
+    called = threading.Event()
+    release = threading.Event()
+
+    def slow_price_provider(symbols):  # noqa: ANN001
+        calls.append(time.monotonic())
+        called.set()
+        assert release.wait(5)
+        return {"SWDA.MI": 100.0}
+
+    monitor = EtfMonitor(
+        _make_config(["SWDA.MI"]), dependencies=MonitorDependencies(price_provider=slow_price_provider)
+    )
+    monitor.start()
+    try:
+        assert called.wait(5)
+        assert monitor.request_poll() == "running"
+        called.clear()
+        release.set()
+        assert monitor.request_poll(force=True) == "scheduled"
+        assert called.wait(5)
+        assert len(calls) == 2
+        deadline = time.monotonic() + 5
+        while (outcome := monitor.request_poll()) == "running" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert outcome == "recent"
+    finally:
+        started = time.monotonic()
+        monitor.stop()
+    assert time.monotonic() - started < 2
+    assert not monitor._thread.is_alive()
+
+
+def test_run_once_stamps_last_run_when_poll_finishes(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("app.storage.STATE_PATH", tmp_path / "monitor_state.json")
+    provider_times: list[float] = []
+
+    def price_provider(symbols):  # noqa: ANN001
+        provider_times.append(time.monotonic())
+        return {"SWDA.MI": 100.0}
+
+    monitor = EtfMonitor(
+        _make_config(["SWDA.MI"]), dependencies=MonitorDependencies(price_provider=price_provider)
+    )
+    monitor.run_once()
+    assert monitor._last_run_monotonic >= provider_times[0]
+
+
+def test_monitor_delivers_alerts_after_restart(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("app.storage.STATE_PATH", tmp_path / "monitor_state.json")
+    sent_titles: list[str] = []
+    sent = threading.Event()
+
+    def fake_send_notification(self, title: str, message: str, data=None) -> None:  # noqa: ANN001
+        sent_titles.append(title)
+        sent.set()
+
+    monkeypatch.setattr("app.ha_client.HomeAssistantClient.send_notification", fake_send_notification)
+    polls: list[float] = []
+
+    def rising_price_provider(symbols):  # noqa: ANN001
+        polls.append(100.0 * 1.1 ** len(polls))
+        return {"SWDA.MI": polls[-1]}
+
+    monitor = EtfMonitor(
+        _make_config(["SWDA.MI"]), dependencies=MonitorDependencies(price_provider=rising_price_provider)
+    )
+    monitor.start()
+    try:
+        assert monitor.request_poll(force=True) == "scheduled"
+        assert sent.wait(5)
+    finally:
+        monitor.stop()
+
+    sent.clear()
+    monitor.start()
+    try:
+        assert sent.wait(5)
+    finally:
+        monitor.stop()
+    assert sent_titles == ["ETF SWDA.MI salito", "ETF SWDA.MI salito"]
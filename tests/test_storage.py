@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.storage import MonitorState, load_state, save_state
+
+
+def test_save_state_replaces_file_atomically(monkeypatch, tmp_path: Path) -> None:
+    state_path = tmp_path / "monitor_state.json"
+    monkeypatch.setattr("app.storage.STATE_PATH", state_path)
+
+    save_state(MonitorState(baselines={"SWDA.MI": 100.0}, last_baseline_update="2024-05-02T10:00:00"))
+    save_state(MonitorState(baselines={"SWDA.MI": 103.0}, last_baseline_update="2024-05-02T11:00:00"))
+
+    assert load_state() == MonitorState(baselines={"SWDA.MI": 103.0}, last_baseline_update="2024-05-02T11:00:00")
+    assert list(tmp_path.iterdir()) == [state_path]